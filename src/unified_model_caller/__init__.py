@@ -1,4 +1,5 @@
 from . import errors
+from .cache import CacheBackend, LRUCache
 from .core import LLMCaller
 from .errors import (
     ApiCallError,
@@ -19,6 +20,8 @@ from .services.base import BaseService
 __all__ = [
     "LLMCaller",
     "BaseService",
+    "CacheBackend",
+    "LRUCache",
     "errors",
     "UnifiedModelCallerError",
     "InvalidServiceError",
@@ -0,0 +1,73 @@
+"""Response caches that let LLMCaller answer repeated prompts without calling the API.
+
+A cache is any object implementing the `CacheBackend` protocol, so an in-process
+`LRUCache` can be swapped for a shared store (Redis, a file, ...) by writing a
+small adapter with `get` and `set` methods.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> str | None:
+        """Returns the cached response for `key`, or None on a miss."""
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        """Stores `value` as the response for `key`."""
+        ...
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory cache with least-recently-used eviction and an optional TTL.
+
+    Args:
+        max_size (int): Maximum number of responses kept; the least recently used
+            entry is evicted once it is exceeded.
+        ttl (float | None): Seconds after which an entry expires, or None to keep
+            entries until they are evicted.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cache_key(service: str, model: str, prompt: str) -> str:
+    """Builds the SHA-256 cache key identifying a prompt sent to a service's model."""
+    payload = json.dumps({"service": service, "model": model, "prompt": prompt}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
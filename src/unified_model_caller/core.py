@@ -1,51 +1,148 @@
-import importlib
+import asyncio
+import functools
 import importlib.util
 import inspect
-import pkgutil
+import random
 import time
-from pathlib import Path
+from collections.abc import Iterator
 
-from unified_model_caller.errors import InvalidServiceError
+from unified_model_caller.cache import CacheBackend, cache_key
+from unified_model_caller.errors import InvalidServiceError, ModelOverloadedError, RateLimitError
+from unified_model_caller.services.anthropic import AnthropicService
+from unified_model_caller.services.aristote import AristoteService
+from unified_model_caller.services.aristoteonmydocker import AristoteOnMyDockerService
 from unified_model_caller.services.base import BaseService
+from unified_model_caller.services.google import GoogleService
+from unified_model_caller.services.ilaas import IlaasService
+from unified_model_caller.services.openai import OpenAIService
+from unified_model_caller.services.xai import XAIService
 
+# Registry of services by lowercase name; add_service() extends it at runtime.
+_SERVICES: dict[str, type[BaseService]] = {
+    "openai": OpenAIService,
+    "anthropic": AnthropicService,
+    "google": GoogleService,
+    "xai": XAIService,
+    "ilaas": IlaasService,
+    "aristote": AristoteService,
+    "aristote-on-mydocker": AristoteOnMyDockerService,
+}
 
-def _load_services() -> dict[str, type[BaseService]]:
-    registry: dict[str, type[BaseService]] = {}
-    services_path = Path(__file__).parent / "services"
-    for _, module_name, _ in pkgutil.iter_modules([str(services_path)]):
-        if module_name == "base" or module_name.startswith("_"):
-            continue
-        module = importlib.import_module(f"unified_model_caller.services.{module_name}")
-        for _, cls in inspect.getmembers(module, inspect.isclass):
-            if issubclass(cls, BaseService) and cls is not BaseService:
-                name = cls("").get_name().lower()
-                registry[name] = cls
-    return registry
+# Transient failures that are worth retrying after a backoff.
+_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (RateLimitError, ModelOverloadedError)
+
+
+def _specialization_setting(name: str) -> property:
+    """An LLMCaller setting that decides whether `call` can skip straight to the service."""
+    attr = f"_{name}"
 
+    def fget(self):
+        return getattr(self, attr)
 
-_SERVICES: dict[str, type[BaseService]] = _load_services()
+    def fset(self, value) -> None:
+        setattr(self, attr, value)
+        if "_cooldown_s" in self.__dict__:
+            self._specialize()
+
+    return property(fget, fset)
 
 
 class LLMCaller:
     """
     A unified caller for various Large Language Model (LLM) APIs.
 
-    Dynamically discovers available services from the `services/` directory.
-    Adding a new service requires only creating a new file there with a class
-    that inherits from BaseService.
+    Built-in services are listed in the `_SERVICES` registry. Adding a new one
+    requires a BaseService subclass in the `services/` directory and an entry in
+    the registry; external services can be registered at runtime with `add_service`.
     """
 
-    def __init__(self, service: str, model: str, api_key: str = ""):
-        service_key = service.lower()
-        if service_key not in _SERVICES:
+    model = _specialization_setting("model")
+    max_retries = _specialization_setting("max_retries")
+    cache = _specialization_setting("cache")
+    respect_cooldown = _specialization_setting("respect_cooldown")
+
+    def __init__(
+        self,
+        service: str,
+        model: str,
+        api_key: str | list[str] = "",
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
+        jitter: float = 0.5,
+        cache: CacheBackend | None = None,
+        respect_cooldown: bool = True,
+    ):
+        """
+        Args:
+            service (str): Case-insensitive name of a registered service.
+            model (str): Model identifier passed directly to the provider.
+            api_key (str | list[str]): API key; can be omitted for services that don't require
+                one. Given a list of keys, calls rotate round-robin across them, and a key that
+                gets rate-limited sits out the service cooldown while the others keep serving.
+            max_retries (int): How many times a call failing with RateLimitError or
+                ModelOverloadedError is retried before the error is raised. 0 disables retries.
+            backoff_base (float): Delay in seconds before the first retry; doubled on each
+                subsequent retry. Retries also wait out the service cooldown when
+                `respect_cooldown` is set, whichever of the two is longer.
+            backoff_cap (float): Upper bound in seconds for the exponential part of the delay.
+            jitter (float): Upper bound in seconds of the random delay added to every backoff,
+                so concurrent callers don't retry in lockstep.
+            cache (CacheBackend | None): Where to cache responses, e.g. an `LRUCache`. A prompt
+                already answered by the same service and model is then served from the cache
+                without calling the API. None (the default) disables caching.
+            respect_cooldown (bool): Whether calls wait so that consecutive requests made with
+                the same key are at least the service cooldown apart. Disable it to send
+                concurrent `acall` requests without spacing, relying on retries instead.
+        """
+        service_cls = _SERVICES.get(service.lower())
+        if service_cls is None:
             raise InvalidServiceError(f"'{service}' is not a valid service. Available: {list(_SERVICES.keys())}")
         self.model = model
         self.service_name = service
-        self._service: BaseService = _SERVICES[service_key](api_key)
+        keys = [api_key] if isinstance(api_key, str) else list(api_key)
+        if not keys:
+            raise ValueError("api_key must be a key or a non-empty list of keys")
+        self._services: list[BaseService] = [service_cls(key) for key in keys]
+        self._service: BaseService = self._services[0]
+        # Per-key monotonic time before which the key should not be used again.
+        self._next_ok_at: list[float] = [0.0] * len(keys)
+        self._next_key = 0
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.cache = cache
+        self.respect_cooldown = respect_cooldown
+        self._cooldown_s = self._service.service_cooldown() / 1000
+        self._specialize()
+
+    def _specialize(self) -> None:
+        """
+        Binds `call` directly to the service's handler when none of the retry, cache,
+        cooldown, or key-rotation logic can apply, saving the wrapper on every call.
+        Re-run whenever one of the settings it depends on changes. Subclasses that
+        override `call` are left alone.
+        """
+        self.__dict__.pop("call", None)
+        if (
+            type(self).call is LLMCaller.call
+            and len(self._services) == 1
+            and self.max_retries == 0
+            and self.cache is None
+            and (self._cooldown_s == 0 or not self.respect_cooldown)
+        ):
+            self.__dict__["call"] = functools.partial(self._service.call, self.model)
 
     def wait_cooldown(self) -> None:
-        """Waits the amount of time required by the service to respect rate limits."""
-        time.sleep(self._service.service_cooldown() / 1000)
+        """
+        Waits until a key is out of its cooldown, i.e. until the next call can go out
+        without being delayed. `call` and `acall` already do this, so calling it is
+        only needed to pace work done between calls.
+        """
+        delay = min(self._next_ok_at) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
 
     def requires_token(self) -> bool:
         """Returns true if the service requires token and False otherwise."""
@@ -94,5 +191,219 @@ class LLMCaller:
         Raises:
             ApiCallError: Or one of its subclasses (AuthenticationError,
                 NotFoundError, RateLimitError, ...) describing why the call failed.
+                RateLimitError and ModelOverloadedError are only raised once
+                `max_retries` retries have been exhausted; each retry waits for the
+                backoff delay or the service cooldown, whichever is longer.
         """
-        return self._service.call(self.model, prompt)
+        if self.cache is not None:
+            key = self._cache_key(prompt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        attempt = 0
+        while True:
+            index, delay = self._pick_key()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                response = self._services[index].call(self.model, prompt)
+                break
+            except _RETRYABLE_ERRORS:
+                if attempt >= self.max_retries:
+                    raise
+                self._rest_key(index, attempt)
+                attempt += 1
+        if self.cache is not None:
+            self.cache.set(key, response)
+        return response
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        """
+        Sends a prompt to the configured LLM and yields the response text as it is
+        generated, so the first words can be shown before the answer is complete.
+
+        Rate-limited or overloaded calls are retried like in `call`, but only until
+        the first piece of text arrives; a stream interrupted after that raises.
+
+        Args:
+            prompt (str): The input text to send to the model.
+
+        Yields:
+            str: Successive pieces of the text generated by the model.
+
+        Raises:
+            ApiCallError: Or one of its subclasses, as `call` does.
+        """
+        if self.cache is not None:
+            key = self._cache_key(prompt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+        attempt = 0
+        while True:
+            index, delay = self._pick_key()
+            if delay > 0:
+                time.sleep(delay)
+            pieces: list[str] = []
+            try:
+                for piece in self._services[index].stream(self.model, prompt):
+                    pieces.append(piece)
+                    yield piece
+                break
+            except _RETRYABLE_ERRORS:
+                if pieces or attempt >= self.max_retries:
+                    raise
+                self._rest_key(index, attempt)
+                attempt += 1
+        if self.cache is not None:
+            self.cache.set(key, "".join(pieces))
+
+    async def acall(self, prompt: str) -> str:
+        """
+        Async variant of `call`, using the provider's native async client when
+        the service offers one.
+
+        Args:
+            prompt (str): The input text to send to the model.
+
+        Returns:
+            str: The text generated by the model.
+
+        Raises:
+            ApiCallError: Or one of its subclasses, exactly as `call` does.
+        """
+        return await self._acall(prompt, reserve=True)
+
+    async def _acall(self, prompt: str, reserve: bool) -> str:
+        if self.cache is not None:
+            key = self._cache_key(prompt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        attempt = 0
+        while True:
+            index, delay = self._pick_key(reserve)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                response = await self._services[index].acall(self.model, prompt)
+                break
+            except _RETRYABLE_ERRORS:
+                if attempt >= self.max_retries:
+                    raise
+                self._rest_key(index, attempt)
+                attempt += 1
+        if self.cache is not None:
+            self.cache.set(key, response)
+        return response
+
+    async def acall_many(self, prompts: list[str]) -> list[str]:
+        """
+        Sends every prompt concurrently and returns the responses in the same order.
+
+        The requests are not spaced by the service cooldown, which would serialize
+        them; they rotate over the keys, and those the provider rate-limits are
+        retried with backoff like in `call`.
+
+        Args:
+            prompts (list[str]): The input texts to send to the model.
+
+        Returns:
+            list[str]: The text generated for each prompt, in order.
+        """
+        return await asyncio.gather(*(self._acall(prompt, reserve=False) for prompt in prompts))
+
+    def call_batch(self, prompts: list[str], poll_interval: float = 30.0) -> list[str]:
+        """
+        Sends a large offline batch of prompts and returns the responses in the same order.
+
+        Services with a batch API (OpenAI, Anthropic) submit every prompt as a single
+        batch job, which is cheaper than individual calls but can take minutes to
+        hours to complete. Other services fall back to `acall_many`. Must not be
+        called from a running event loop.
+
+        Args:
+            prompts (list[str]): The input texts to send to the model.
+            poll_interval (float): Seconds between two checks of the batch job status.
+
+        Returns:
+            list[str]: The text generated for each prompt, in order.
+
+        Raises:
+            ApiCallError: Or one of its subclasses, if the batch job or any prompt in it failed.
+        """
+        if not prompts:
+            return []
+        if not self._service.supports_batch():
+            return asyncio.run(self.acall_many(prompts))
+        index, delay = self._pick_key()
+        if delay > 0:
+            time.sleep(delay)
+        return self._services[index].call_batch(self.model, prompts, poll_interval)
+
+    def prewarm(self) -> None:
+        """
+        Opens connections to the provider ahead of the first call, so the first
+        prompts of a batch don't pay the TCP + TLS handshake. Failures are ignored:
+        prewarming is only an optimization, and the real call reports real errors.
+        """
+        for service in self._services:
+            try:
+                service.prewarm()
+            except Exception:
+                pass
+
+    async def aprewarm(self) -> None:
+        """
+        Async variant of `prewarm`, warming every key's connections concurrently.
+
+        Async connections belong to the event loop they were opened on, so await
+        this in the same loop as the `acall` work it prepares.
+        """
+        await asyncio.gather(*(service.aprewarm() for service in self._services), return_exceptions=True)
+
+    def _pick_key(self, reserve: bool = True) -> tuple[int, float]:
+        """
+        Picks the key for the next request, round-robin among keys that are not cooling down,
+        and reserves it for the service cooldown when `reserve` and `respect_cooldown` are set.
+
+        Returns:
+            tuple[int, float]: The index of the key and how many seconds to wait before using
+                it, which is only non-zero when every key is cooling down.
+        """
+        now = time.monotonic()
+        count = len(self._services)
+        for offset in range(count):
+            index = (self._next_key + offset) % count
+            if self._next_ok_at[index] <= now:
+                delay = 0.0
+                break
+        else:
+            index = min(range(count), key=self._next_ok_at.__getitem__)
+            delay = self._next_ok_at[index] - now
+        self._next_key = index + 1
+        if reserve and self.respect_cooldown:
+            self._next_ok_at[index] = now + delay + self._cooldown_s
+        return index, delay
+
+    def _rest_key(self, index: int, attempt: int) -> None:
+        """
+        Keeps a rate-limited or overloaded key out of use for the backoff delay of the
+        attempt; with several keys it also sits out the service cooldown while the
+        others serve the retry.
+
+        The retry then waits in `_pick_key`, so a backoff shorter than the cooldown
+        already reserved by the failed request adds no extra delay.
+        """
+        rest = self._backoff_delay(attempt)
+        if len(self._services) > 1:
+            rest = max(rest, self._cooldown_s)
+        self._next_ok_at[index] = max(self._next_ok_at[index], time.monotonic() + rest)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (0-based): capped exponential plus jitter."""
+        return min(self.backoff_cap, self.backoff_base * 2**attempt) + random.random() * self.jitter
+
+    def _cache_key(self, prompt: str) -> str:
+        return cache_key(self._service.get_name(), self.model, prompt)
@@ -19,6 +19,13 @@ Catching `ApiCallError` handles every failure of an API call; catching
 `UnifiedModelCallerError` handles everything the library can raise.
 """
 
+import re
+
+# Compiled once and matched case-insensitively, so long provider error payloads
+# don't have to be lowercased on every failure.
+_OVERLOAD_RE = re.compile(r"overload", re.IGNORECASE)
+_RATE_LIMIT_RE = re.compile(r"rate[_ ]?limit|resource.?exhausted", re.IGNORECASE)
+
 
 class UnifiedModelCallerError(Exception):
     """Base class for all errors raised by this library."""
@@ -78,6 +85,16 @@ class InvalidResponseError(ApiCallError):
     """The provider answered, but the response was empty or malformed."""
 
 
+def is_overloaded(message: str) -> bool:
+    """Whether a provider error message reports the model as overloaded."""
+    return _OVERLOAD_RE.search(message) is not None
+
+
+def is_rate_limited(message: str) -> bool:
+    """Whether a provider error message reports a rate limit or exhausted quota."""
+    return _RATE_LIMIT_RE.search(message) is not None
+
+
 def error_from_status(status_code: int, message: str, service: str | None = None) -> ApiCallError:
     """Builds the ApiCallError subclass matching an HTTP status code.
 
@@ -93,7 +110,7 @@ def error_from_status(status_code: int, message: str, service: str | None = None
         error_cls = RateLimitError
     elif status_code in (400, 422):
         error_cls = BadRequestError
-    elif status_code == 529 or (status_code >= 500 and "overload" in message.lower()):
+    elif status_code == 529 or (status_code >= 500 and is_overloaded(message)):
         error_cls = ModelOverloadedError
     elif status_code >= 500:
         error_cls = ServiceUnavailableError
@@ -0,0 +1,88 @@
+"""Process-wide cache of provider clients, so calls reuse open connections.
+
+Building an SDK client per call throws away its connection pool, paying a fresh
+TCP + TLS handshake on every request. Clients are instead cached by
+``(service, api_key)`` and shared by every LLMCaller in the process.
+"""
+
+import asyncio
+import importlib
+import weakref
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any, TypeVar
+
+import httpx
+
+from unified_model_caller.errors import ApiCallError
+
+T = TypeVar("T")
+
+# Pool sized for a batch of concurrent calls; idle connections stay open for reuse.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+# Default for requests that don't set their own timeout. SDKs handed this client
+# would adopt it in place of their own defaults, so they get their timeout explicitly.
+_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# Shared by the plain-HTTP services and handed to the SDKs that accept a custom
+# httpx client (OpenAI, Gemini), so those providers draw from one tuned pool.
+HTTP_CLIENT = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+_CLIENT_CACHE: dict[tuple[str, str], Any] = {}
+
+# Async clients hold connections bound to the event loop they were first used
+# on, so they are cached per loop and dropped together with it.
+_ASYNC_CLIENT_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def require_package(module: str, package: str, service: str) -> ModuleType:
+    """Imports the SDK a service depends on, raising ApiCallError when it is not installed.
+
+    Provider SDKs take up to seconds to import, so services call this on first use
+    rather than at import time, and providers that are never used are never imported.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ApiCallError(
+            f"The '{package}' package is required by the {service} service but is not installed",
+            service=service,
+        ) from e
+
+
+def get_client(service: str, api_key: str, factory: Callable[[], T]) -> T:
+    """Returns the cached client for `(service, api_key)`, building it with `factory` on first use."""
+    key = (service, api_key)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE.setdefault(key, factory())
+    return client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Returns the async counterpart of `HTTP_CLIENT` for the running event loop."""
+    return get_async_client(
+        "http", "", lambda: httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    )
+
+
+def prewarm_url(url: str) -> None:
+    """Opens a pooled connection to `url`'s host with a HEAD request, whatever it answers."""
+    HTTP_CLIENT.head(url)
+
+
+async def aprewarm_url(url: str) -> None:
+    """Async variant of `prewarm_url`, warming the running loop's pool."""
+    await get_async_http_client().head(url)
+
+
+def get_async_client(service: str, api_key: str, factory: Callable[[], T]) -> T:
+    """Like `get_client`, but scoped to the running event loop."""
+    loop_cache = _ASYNC_CLIENT_CACHE.setdefault(asyncio.get_running_loop(), {})
+    key = (service, api_key)
+    client = loop_cache.get(key)
+    if client is None:
+        client = loop_cache.setdefault(key, factory())
+    return client
@@ -1,12 +1,75 @@
 """Shared helper for services that call an OpenAI-compatible HTTP endpoint directly."""
 
-import requests
+from collections.abc import Iterator
+
+import httpx
+import orjson
 
 from unified_model_caller.errors import (
+    ApiCallError,
     ApiConnectionError,
     InvalidResponseError,
+    ModelOverloadedError,
+    RateLimitError,
     error_from_status,
+    is_overloaded,
+    is_rate_limited,
+)
+from unified_model_caller.services._clients import (
+    HTTP_CLIENT,
+    aprewarm_url,
+    get_async_http_client,
+    prewarm_url,
 )
+from unified_model_caller.services.base import BaseService
+
+
+class ChatCompletionService(BaseService):
+    """
+    Base for services exposing an OpenAI-compatible chat-completion endpoint.
+
+    Subclasses set `endpoint` and implement the descriptive methods (`get_name`,
+    `requires_token`, `service_cooldown`); the API key is only sent to services
+    that require one.
+    """
+
+    endpoint: str
+
+    def call(self, model: str, prompt: str) -> str:
+        return post_chat_completion(
+            endpoint=self.endpoint,
+            model=model,
+            prompt=prompt,
+            service=self.get_name(),
+            api_key=self._auth_key(),
+        )
+
+    async def acall(self, model: str, prompt: str) -> str:
+        return await apost_chat_completion(
+            endpoint=self.endpoint,
+            model=model,
+            prompt=prompt,
+            service=self.get_name(),
+            api_key=self._auth_key(),
+        )
+
+    def stream(self, model: str, prompt: str) -> Iterator[str]:
+        return stream_chat_completion(
+            endpoint=self.endpoint,
+            model=model,
+            prompt=prompt,
+            service=self.get_name(),
+            api_key=self._auth_key(),
+        )
+
+    def prewarm(self) -> None:
+        prewarm_url(self.endpoint)
+
+    async def aprewarm(self) -> None:
+        await aprewarm_url(self.endpoint)
+
+    def _auth_key(self) -> str:
+        return self.api_key if self.requires_token() else ""
 
 
 def post_chat_completion(
@@ -23,6 +86,81 @@ def post_chat_completion(
     when the endpoint cannot be reached, the status-code-specific error for
     non-2xx responses, and InvalidResponseError for unusable response bodies.
     """
+    headers, data = _build_request(model, prompt, api_key)
+    try:
+        response = HTTP_CLIENT.post(endpoint, content=orjson.dumps(data), headers=headers, timeout=_timeout(timeout))
+    except httpx.HTTPError as e:
+        raise ApiConnectionError(f"Could not reach the {service} API: {e}", service=service) from e
+    return _parse_response(response, service)
+
+
+async def apost_chat_completion(
+    endpoint: str,
+    model: str,
+    prompt: str,
+    service: str,
+    api_key: str = "",
+    timeout: float = 120,
+) -> str:
+    """Async variant of `post_chat_completion`, raising the same errors."""
+    headers, data = _build_request(model, prompt, api_key)
+    try:
+        client = get_async_http_client()
+        response = await client.post(
+            endpoint, content=orjson.dumps(data), headers=headers, timeout=_timeout(timeout)
+        )
+    except httpx.HTTPError as e:
+        raise ApiConnectionError(f"Could not reach the {service} API: {e}", service=service) from e
+    return _parse_response(response, service)
+
+
+def stream_chat_completion(
+    endpoint: str,
+    model: str,
+    prompt: str,
+    service: str,
+    api_key: str = "",
+    timeout: float = 120,
+) -> Iterator[str]:
+    """Streaming variant of `post_chat_completion`, yielding text deltas from the server-sent events."""
+    headers, data = _build_request(model, prompt, api_key)
+    data["stream"] = True
+    try:
+        with HTTP_CLIENT.stream(
+            "POST", endpoint, content=orjson.dumps(data), headers=headers, timeout=_timeout(timeout)
+        ) as response:
+            if not response.is_success:
+                response.read()
+                _raise_for_status(response, service)
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                payload = line[len("data:"):].strip()
+                if payload == "[DONE]":
+                    break
+                try:
+                    event = orjson.loads(payload)
+                    if isinstance(event, dict) and event.get("error"):
+                        raise _stream_error(event["error"], service)
+                    delta = event["choices"][0]["delta"].get("content")
+                except (orjson.JSONDecodeError, KeyError, IndexError, TypeError, AttributeError) as e:
+                    raise InvalidResponseError(
+                        f"Unexpected stream event from the {service} API: {payload[:500]}",
+                        service=service,
+                        status_code=response.status_code,
+                    ) from e
+                if delta:
+                    yield delta
+    except httpx.HTTPError as e:
+        raise ApiConnectionError(f"Could not reach the {service} API: {e}", service=service) from e
+
+
+def _timeout(timeout: float) -> httpx.Timeout:
+    # Completions can take a while to generate, but an unreachable host should fail fast.
+    return httpx.Timeout(timeout, connect=10.0)
+
+
+def _build_request(model: str, prompt: str, api_key: str) -> tuple[dict[str, str], dict]:
     headers = {"Content-Type": "application/json"}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
@@ -30,22 +168,38 @@ def post_chat_completion(
         "model": model,
         "messages": [{"role": "user", "content": prompt}],
     }
-    try:
-        response = requests.post(endpoint, json=data, headers=headers, timeout=timeout)
-    except requests.RequestException as e:
-        raise ApiConnectionError(f"Could not reach the {service} API: {e}", service=service) from e
+    return headers, data
+
 
-    if not response.ok:
-        detail = response.text.strip()[:500] or response.reason
+def _raise_for_status(response: httpx.Response, service: str) -> None:
+    if not response.is_success:
+        detail = response.text.strip()[:500] or response.reason_phrase
         raise error_from_status(
             response.status_code,
             f"The {service} API returned HTTP {response.status_code}: {detail}",
             service=service,
         )
 
+
+def _stream_error(error, service: str) -> ApiCallError:
+    """Classifies an error event sent in place of a completion chunk, e.g. when the model gets overloaded."""
+    code = error.get("code") if isinstance(error, dict) else None
+    message = error.get("message", error) if isinstance(error, dict) else error
+    detail = f"The {service} API reported a stream error: {message}"
+    if is_overloaded(str(message)):
+        return ModelOverloadedError(detail, service=service, status_code=code if isinstance(code, int) else None)
+    if isinstance(code, int):
+        return error_from_status(code, detail, service=service)
+    if is_rate_limited(f"{code} {message}"):
+        return RateLimitError(detail, service=service)
+    return ApiCallError(detail, service=service)
+
+
+def _parse_response(response: httpx.Response, service: str) -> str:
+    _raise_for_status(response, service)
     try:
-        content = response.json()["choices"][0]["message"]["content"]
-    except (ValueError, KeyError, IndexError, TypeError) as e:
+        content = orjson.loads(response.content)["choices"][0]["message"]["content"]
+    except (orjson.JSONDecodeError, KeyError, IndexError, TypeError) as e:
         raise InvalidResponseError(
             f"Unexpected response format from the {service} API: {response.text.strip()[:500]}",
             service=service,
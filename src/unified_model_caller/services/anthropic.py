@@ -1,5 +1,25 @@
+import time
+from collections.abc import Iterator
+
+from unified_model_caller.services._clients import get_async_client, get_client, require_package
 from unified_model_caller.services.base import BaseService
-from unified_model_caller.errors import ApiConnectionError, InvalidResponseError, error_from_status
+from unified_model_caller.errors import (
+    ApiCallError,
+    ApiConnectionError,
+    InvalidResponseError,
+    ModelOverloadedError,
+    error_from_status,
+    is_overloaded,
+)
+
+# Imported on first use by _load_sdk(), see require_package().
+anthropic = None
+
+
+def _load_sdk(service: str) -> None:
+    global anthropic
+    if anthropic is None:
+        anthropic = require_package("anthropic", "anthropic", service)
 
 
 class AnthropicService(BaseService):
@@ -13,8 +33,7 @@ class AnthropicService(BaseService):
         return 5000
 
     def call(self, model: str, prompt: str) -> str:
-        import anthropic
-        client = anthropic.Anthropic(api_key=self.api_key)
+        client = self._client()
         messages = [anthropic.types.MessageParam(content=prompt, role='user')]
         try:
             response = client.messages.create(
@@ -22,14 +41,117 @@ class AnthropicService(BaseService):
                 messages=messages,
                 model=model,
             )
-        except anthropic.APIStatusError as e:
-            raise error_from_status(e.status_code, f"Anthropic API call failed: {e}", service=self.get_name()) from e
-        except anthropic.APIConnectionError as e:
-            raise ApiConnectionError(f"Could not reach the Anthropic API: {e}", service=self.get_name()) from e
-        text_resps = [resp for resp in response.content if resp.type == "text"]
-        if len(text_resps) == 0:
+        except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+            raise self._translate_error(e) from e
+        return self._extract_text(model, response)
+
+    async def acall(self, model: str, prompt: str) -> str:
+        client = self._async_client()
+        messages = [anthropic.types.MessageParam(content=prompt, role='user')]
+        try:
+            response = await client.messages.create(
+                max_tokens=10000,
+                messages=messages,
+                model=model,
+            )
+        except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+            raise self._translate_error(e) from e
+        return self._extract_text(model, response)
+
+    def stream(self, model: str, prompt: str) -> Iterator[str]:
+        client = self._client()
+        messages = [anthropic.types.MessageParam(content=prompt, role='user')]
+        try:
+            with client.messages.stream(
+                max_tokens=10000,
+                messages=messages,
+                model=model,
+            ) as response:
+                yield from response.text_stream
+        except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+            raise self._translate_error(e) from e
+
+    def supports_batch(self) -> bool:
+        return True
+
+    def call_batch(self, model: str, prompts: list[str], poll_interval: float) -> list[str]:
+        client = self._client()
+        requests = [
+            {
+                "custom_id": str(index),
+                "params": {
+                    "model": model,
+                    "max_tokens": 10000,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for index, prompt in enumerate(prompts)
+        ]
+        results: dict[int, str] = {}
+        failures: dict[int, str] = {}
+        try:
+            batch = client.messages.batches.create(requests=requests)
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = client.messages.batches.retrieve(batch.id)
+            for item in client.messages.batches.results(batch.id):
+                index = int(item.custom_id)
+                result = item.result
+                if result.type == "succeeded":
+                    results[index] = self._extract_text(model, result.message)
+                elif result.type == "errored":
+                    failures[index] = result.error.error.message
+                else:
+                    failures[index] = result.type
+        except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+            raise self._translate_error(e) from e
+
+        if failures:
+            details = "; ".join(f"prompt {index}: {failures[index]}" for index in sorted(failures))
+            raise ApiCallError(
+                f"{len(failures)} of {len(prompts)} Anthropic batch requests failed: {details}",
+                service=self.get_name(),
+            )
+
+        missing = [index for index in range(len(prompts)) if index not in results]
+        if missing:
+            raise InvalidResponseError(
+                f"The Anthropic batch results are missing prompts {missing}", service=self.get_name()
+            )
+        return [results[index] for index in range(len(prompts))]
+
+    def prewarm(self) -> None:
+        # The client keeps its own connection pool; a one-item model listing opens it without using tokens.
+        self._client().with_options(max_retries=0).models.list(limit=1)
+
+    async def aprewarm(self) -> None:
+        await self._async_client().with_options(max_retries=0).models.list(limit=1)
+
+    def _client(self):
+        _load_sdk(self.get_name())
+        return get_client(self.get_name(), self.api_key, lambda: anthropic.Anthropic(api_key=self.api_key))
+
+    def _async_client(self):
+        _load_sdk(self.get_name())
+        return get_async_client(
+            self.get_name(), self.api_key, lambda: anthropic.AsyncAnthropic(api_key=self.api_key)
+        )
+
+    def _translate_error(self, e: Exception) -> ApiCallError:
+        if isinstance(e, anthropic.APIStatusError):
+            # Overload can also arrive with a non-5xx status, e.g. as an error event mid-stream
+            if is_overloaded(str(e)):
+                return ModelOverloadedError(
+                    f"Anthropic model overloaded: {e}", service=self.get_name(), status_code=e.status_code
+                )
+            return error_from_status(e.status_code, f"Anthropic API call failed: {e}", service=self.get_name())
+        return ApiConnectionError(f"Could not reach the Anthropic API: {e}", service=self.get_name())
+
+    def _extract_text(self, model: str, response) -> str:
+        text = next((block.text for block in response.content if block.type == "text"), None)
+        if text is None:
             raise InvalidResponseError(
                 f"The call to the Anthropic {model} model didn't provide any text response",
                 service=self.get_name(),
             )
-        return text_resps[0].text
+        return text
@@ -1,7 +1,9 @@
-from unified_model_caller.services.base import BaseService
+from unified_model_caller.services._http import ChatCompletionService
 
 
-class IlaasService(BaseService):
+class AristoteService(ChatCompletionService):
+    endpoint = "https://llm.aristote.education/v1/chat/completions"
+
     def get_name(self) -> str:
         return "aristote"
 
@@ -10,13 +12,3 @@ class IlaasService(BaseService):
 
     def service_cooldown(self) -> int:
         return 0
-
-    def call(self, model: str, prompt: str) -> str:
-        from unified_model_caller.services._http import post_chat_completion
-        return post_chat_completion(
-            endpoint="https://llm.aristote.education/v1/chat/completions",
-            model=model,
-            prompt=prompt,
-            service=self.get_name(),
-            api_key=self.api_key,
-        )
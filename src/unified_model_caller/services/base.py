@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 
 class BaseService(ABC):
@@ -8,6 +10,42 @@ class BaseService(ABC):
     @abstractmethod
     def call(self, model: str, prompt: str) -> str: ...
 
+    async def acall(self, model: str, prompt: str) -> str:
+        """Async variant of `call`.
+
+        Runs `call` in a worker thread by default; built-in services override it
+        with their provider's native async client.
+        """
+        return await asyncio.to_thread(self.call, model, prompt)
+
+    def stream(self, model: str, prompt: str) -> Iterator[str]:
+        """
+        Yields the response text piece by piece as the provider generates it.
+
+        Yields the whole `call` result at once by default; built-in services
+        override it with their provider's streaming API.
+        """
+        yield self.call(model, prompt)
+
+    def supports_batch(self) -> bool:
+        """Whether `call_batch` submits to a provider batch API. False by default."""
+        return False
+
+    def call_batch(self, model: str, prompts: list[str], poll_interval: float) -> list[str]:
+        """
+        Submits every prompt as one provider batch job, waits for it, and returns
+        the responses in the order of `prompts`. Only called when `supports_batch`
+        returns True.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch calls")
+
+    def prewarm(self) -> None:
+        """Opens connections to the provider ahead of the first call. Does nothing by default."""
+
+    async def aprewarm(self) -> None:
+        """Async variant of `prewarm`, warming the connections `acall` uses."""
+        await asyncio.to_thread(self.prewarm)
+
     @abstractmethod
     def requires_token(self) -> bool: ...
 
@@ -1,11 +1,38 @@
+from collections.abc import Iterator
+
+from unified_model_caller.services._clients import (
+    HTTP_CLIENT,
+    aprewarm_url,
+    get_async_client,
+    get_async_http_client,
+    get_client,
+    prewarm_url,
+    require_package,
+)
 from unified_model_caller.services.base import BaseService
 from unified_model_caller.errors import (
     ApiCallError,
     ApiConnectionError,
     ModelOverloadedError,
+    RateLimitError,
     error_from_status,
+    is_overloaded,
+    is_rate_limited,
 )
 
+# Imported on first use by _load_sdk(), see require_package().
+genai = g_errors = g_types = None
+
+_BASE_URL = "https://generativelanguage.googleapis.com/"
+
+
+def _load_sdk(service: str) -> None:
+    global genai, g_errors, g_types
+    if genai is None:
+        g_errors = require_package("google.genai.errors", "google-genai", service)
+        g_types = require_package("google.genai.types", "google-genai", service)
+        genai = require_package("google.genai", "google-genai", service)
+
 
 class GoogleService(BaseService):
     def get_name(self) -> str:
@@ -18,37 +45,89 @@ class GoogleService(BaseService):
         return 5000
 
     def call(self, model: str, prompt: str) -> str:
-        from google import genai
-        from google.genai import errors as g_errors
-        from google.genai import types as g_types
-
-        client = genai.Client(api_key=self.api_key)
+        client = self._client()
 
         try:
-            contents = g_types.Content(
-                role='user',
-                parts=[g_types.Part.from_text(text=prompt)]
-            )
             response = client.models.generate_content(
                 model=model,
-                contents=contents
+                contents=self._build_contents(prompt)
             )
             return response.text or ""
+        except Exception as e:
+            raise self._translate_error(e) from e
 
-        except g_errors.APIError as e:
+    async def acall(self, model: str, prompt: str) -> str:
+        client = self._async_client()
+
+        try:
+            response = await client.aio.models.generate_content(
+                model=model,
+                contents=self._build_contents(prompt)
+            )
+            return response.text or ""
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+    def stream(self, model: str, prompt: str) -> Iterator[str]:
+        client = self._client()
+
+        try:
+            for chunk in client.models.generate_content_stream(
+                model=model,
+                contents=self._build_contents(prompt)
+            ):
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+    def prewarm(self) -> None:
+        prewarm_url(_BASE_URL)
+
+    async def aprewarm(self) -> None:
+        await aprewarm_url(_BASE_URL)
+
+    def _client(self):
+        _load_sdk(self.get_name())
+        return get_client(
+            self.get_name(),
+            self.api_key,
+            lambda: genai.Client(api_key=self.api_key, http_options=g_types.HttpOptions(httpx_client=HTTP_CLIENT)),
+        )
+
+    def _async_client(self):
+        _load_sdk(self.get_name())
+        return get_async_client(
+            self.get_name(),
+            self.api_key,
+            lambda: genai.Client(
+                api_key=self.api_key,
+                http_options=g_types.HttpOptions(httpx_async_client=get_async_http_client()),
+            ),
+        )
+
+    def _build_contents(self, prompt: str):
+        return g_types.Content(
+            role='user',
+            parts=[g_types.Part.from_text(text=prompt)]
+        )
+
+    def _translate_error(self, e: Exception) -> ApiCallError:
+        if isinstance(e, g_errors.APIError):
             error_msg = f"Gemini API call failed: {e}"
             # Gemini reports overload as 429 RESOURCE_EXHAUSTED or 503 UNAVAILABLE
-            if "overload" in str(e).lower():
-                raise ModelOverloadedError(
+            if is_overloaded(str(e)):
+                return ModelOverloadedError(
                     f"Gemini model overloaded: {e}", service=self.get_name(), status_code=e.code
-                ) from e
+                )
             if isinstance(e.code, int):
-                raise error_from_status(e.code, error_msg, service=self.get_name()) from e
-            raise ApiCallError(error_msg, service=self.get_name()) from e
-        except ConnectionError as e:
-            raise ApiConnectionError(f"Could not reach the Gemini API: {e}", service=self.get_name()) from e
-        except Exception as e:
-            error_msg = str(e)
-            if "overload" in error_msg.lower():
-                raise ModelOverloadedError(f"Gemini model overloaded: {error_msg}", service=self.get_name()) from e
-            raise ApiCallError(f"Gemini API call failed: {e}", service=self.get_name()) from e
+                return error_from_status(e.code, error_msg, service=self.get_name())
+            return ApiCallError(error_msg, service=self.get_name())
+        if isinstance(e, ConnectionError):
+            return ApiConnectionError(f"Could not reach the Gemini API: {e}", service=self.get_name())
+        error_msg = str(e)
+        if is_overloaded(error_msg):
+            return ModelOverloadedError(f"Gemini model overloaded: {error_msg}", service=self.get_name())
+        if is_rate_limited(error_msg):
+            return RateLimitError(f"Gemini API rate limit reached: {error_msg}", service=self.get_name())
+        return ApiCallError(f"Gemini API call failed: {e}", service=self.get_name())
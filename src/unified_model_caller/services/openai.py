@@ -1,5 +1,34 @@
+import json
+import time
+from collections.abc import Iterator
+
+from unified_model_caller.services._clients import (
+    HTTP_CLIENT,
+    aprewarm_url,
+    get_async_client,
+    get_async_http_client,
+    get_client,
+    prewarm_url,
+    require_package,
+)
 from unified_model_caller.services.base import BaseService
-from unified_model_caller.errors import ApiConnectionError, InvalidResponseError, error_from_status
+from unified_model_caller.errors import (
+    ApiCallError,
+    ApiConnectionError,
+    InvalidResponseError,
+    ModelOverloadedError,
+    error_from_status,
+    is_overloaded,
+)
+
+# Imported on first use by _load_sdk(), see require_package().
+openai = None
+
+
+def _load_sdk(service: str) -> None:
+    global openai
+    if openai is None:
+        openai = require_package("openai", "openai", service)
 
 
 class OpenAIService(BaseService):
@@ -13,17 +42,164 @@ class OpenAIService(BaseService):
         return 5000
 
     def call(self, model: str, prompt: str) -> str:
-        import openai
-        client = openai.OpenAI(api_key=self.api_key)
+        client = self._client()
         try:
             response = client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}]
             )
-        except openai.APIStatusError as e:
-            raise error_from_status(e.status_code, f"OpenAI API call failed: {e}", service=self.get_name()) from e
-        except openai.APIConnectionError as e:
-            raise ApiConnectionError(f"Could not reach the OpenAI API: {e}", service=self.get_name()) from e
+        except (openai.APIStatusError, openai.APIConnectionError) as e:
+            raise self._translate_error(e) from e
+        return self._extract_text(model, response)
+
+    async def acall(self, model: str, prompt: str) -> str:
+        client = self._async_client()
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        except (openai.APIStatusError, openai.APIConnectionError) as e:
+            raise self._translate_error(e) from e
+        return self._extract_text(model, response)
+
+    def stream(self, model: str, prompt: str) -> Iterator[str]:
+        client = self._client()
+        try:
+            chunks = client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                stream=True,
+            )
+            for chunk in chunks:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except openai.APIError as e:
+            raise self._translate_error(e) from e
+
+    def supports_batch(self) -> bool:
+        return True
+
+    def call_batch(self, model: str, prompts: list[str], poll_interval: float) -> list[str]:
+        client = self._client()
+        lines = [
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": model, "messages": [{"role": "user", "content": prompt}]},
+            })
+            for index, prompt in enumerate(prompts)
+        ]
+        try:
+            batch_file = client.files.create(file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+            if batch.status != "completed":
+                raise ApiCallError(
+                    f"OpenAI batch {batch.id} finished with status '{batch.status}'", service=self.get_name()
+                )
+            # Successful requests land in the output file and failed ones in the error
+            # file; either is absent when no request went that way.
+            output_lines: list[str] = []
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id is not None:
+                    output_lines.extend(client.files.content(file_id).text.splitlines())
+        except (openai.APIStatusError, openai.APIConnectionError) as e:
+            raise self._translate_error(e) from e
+
+        results: dict[int, str] = {}
+        failures: dict[int, str] = {}
+        for line in output_lines:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            index = int(item["custom_id"])
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                failures[index] = self._batch_error(item)
+                continue
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError) as e:
+                raise InvalidResponseError(
+                    f"Unexpected response format for OpenAI batch request {index}", service=self.get_name()
+                ) from e
+            if content is None:
+                raise InvalidResponseError(
+                    f"The call to the OpenAI's {model} model didn't provide any text result",
+                    service=self.get_name(),
+                )
+            results[index] = content
+
+        if failures:
+            details = "; ".join(f"prompt {index}: {failures[index]}" for index in sorted(failures))
+            raise ApiCallError(
+                f"{len(failures)} of {len(prompts)} OpenAI batch requests failed: {details}", service=self.get_name()
+            )
+        missing = [index for index in range(len(prompts)) if index not in results]
+        if missing:
+            raise InvalidResponseError(
+                f"The OpenAI batch output is missing results for prompts {missing}", service=self.get_name()
+            )
+        return [results[index] for index in range(len(prompts))]
+
+    def prewarm(self) -> None:
+        prewarm_url(str(self._client().base_url))
+
+    async def aprewarm(self) -> None:
+        await aprewarm_url(str(self._async_client().base_url))
+
+    def _client(self):
+        _load_sdk(self.get_name())
+        return get_client(
+            self.get_name(),
+            self.api_key,
+            lambda: openai.OpenAI(api_key=self.api_key, http_client=HTTP_CLIENT, timeout=openai.DEFAULT_TIMEOUT),
+        )
+
+    def _async_client(self):
+        _load_sdk(self.get_name())
+        return get_async_client(
+            self.get_name(),
+            self.api_key,
+            lambda: openai.AsyncOpenAI(
+                api_key=self.api_key, http_client=get_async_http_client(), timeout=openai.DEFAULT_TIMEOUT
+            ),
+        )
+
+    def _translate_error(self, e: Exception) -> ApiCallError:
+        if isinstance(e, openai.APIStatusError):
+            # Overload can also arrive with a non-5xx status
+            if is_overloaded(str(e)):
+                return ModelOverloadedError(
+                    f"OpenAI model overloaded: {e}", service=self.get_name(), status_code=e.status_code
+                )
+            return error_from_status(e.status_code, f"OpenAI API call failed: {e}", service=self.get_name())
+        if isinstance(e, openai.APIConnectionError):
+            return ApiConnectionError(f"Could not reach the OpenAI API: {e}", service=self.get_name())
+        # A plain APIError carries no status, e.g. an error event received mid-stream
+        if is_overloaded(str(e)):
+            return ModelOverloadedError(f"OpenAI model overloaded: {e}", service=self.get_name())
+        return ApiCallError(f"OpenAI API call failed: {e}", service=self.get_name())
+
+    @staticmethod
+    def _batch_error(item: dict) -> str:
+        """Describes a failed line of a batch output or error file."""
+        response = item.get("response") or {}
+        body = response.get("body") or {}
+        error = item.get("error") or body.get("error") or body
+        message = error.get("message", error) if isinstance(error, dict) else error
+        status_code = response.get("status_code")
+        return f"HTTP {status_code}: {message}" if status_code else str(message)
+
+    def _extract_text(self, model: str, response) -> str:
         res = response.choices[0].message.content
         if res is None:
             raise InvalidResponseError(
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+
+from unified_model_caller.services._clients import get_async_client, get_client, require_package
 from unified_model_caller.services.base import BaseService
 from unified_model_caller.errors import (
     ApiCallError,
@@ -9,6 +12,31 @@ from unified_model_caller.errors import (
     ServiceUnavailableError,
 )
 
+# Imported on first use by _load_sdk(), see require_package().
+grpc = xai_sdk = xai_user = None
+
+
+# Built once at import rather than on every failed call; keyed by
+# grpc.StatusCode name so building it does not need the SDK imported.
+_GRPC_ERRORS: dict[str, type[ApiCallError]] = {
+    "UNAUTHENTICATED": AuthenticationError,
+    "PERMISSION_DENIED": AuthenticationError,
+    "NOT_FOUND": NotFoundError,
+    "INVALID_ARGUMENT": BadRequestError,
+    "RESOURCE_EXHAUSTED": RateLimitError,
+    "UNAVAILABLE": ServiceUnavailableError,
+    "INTERNAL": ServiceUnavailableError,
+    "DEADLINE_EXCEEDED": ApiConnectionError,
+}
+
+
+def _load_sdk(service: str) -> None:
+    global grpc, xai_sdk, xai_user
+    if xai_sdk is None:
+        grpc = require_package("grpc", "xai-sdk", service)
+        xai_user = require_package("xai_sdk.chat", "xai-sdk", service).user
+        xai_sdk = require_package("xai_sdk", "xai-sdk", service)
+
 
 class XAIService(BaseService):
     def get_name(self) -> str:
@@ -21,29 +49,57 @@ class XAIService(BaseService):
         return 5000
 
     def call(self, model: str, prompt: str) -> str:
-        import grpc
-        import xai_sdk
-        from xai_sdk.chat import user as xai_user
-
-        client = xai_sdk.Client(api_key=self.api_key)
+        client = self._client()
         try:
             response = client.chat.create(
                 model=model,
                 messages=[xai_user(prompt)],
             ).sample()
         except grpc.RpcError as e:
-            code = e.code()
-            message = f"xAI API call failed ({code.name}): {e.details()}"
-            grpc_error_map: dict[grpc.StatusCode, type[ApiCallError]] = {
-                grpc.StatusCode.UNAUTHENTICATED: AuthenticationError,
-                grpc.StatusCode.PERMISSION_DENIED: AuthenticationError,
-                grpc.StatusCode.NOT_FOUND: NotFoundError,
-                grpc.StatusCode.INVALID_ARGUMENT: BadRequestError,
-                grpc.StatusCode.RESOURCE_EXHAUSTED: RateLimitError,
-                grpc.StatusCode.UNAVAILABLE: ServiceUnavailableError,
-                grpc.StatusCode.INTERNAL: ServiceUnavailableError,
-                grpc.StatusCode.DEADLINE_EXCEEDED: ApiConnectionError,
-            }
-            error_cls = grpc_error_map.get(code, ApiCallError)
-            raise error_cls(message, service=self.get_name()) from e
+            raise self._translate_error(e) from e
+        return response.content
+
+    async def acall(self, model: str, prompt: str) -> str:
+        client = self._async_client()
+        try:
+            response = await client.chat.create(
+                model=model,
+                messages=[xai_user(prompt)],
+            ).sample()
+        except grpc.RpcError as e:
+            raise self._translate_error(e) from e
         return response.content
+
+    def stream(self, model: str, prompt: str) -> Iterator[str]:
+        client = self._client()
+        try:
+            chat = client.chat.create(
+                model=model,
+                messages=[xai_user(prompt)],
+            )
+            for _, chunk in chat.stream():
+                if chunk.content:
+                    yield chunk.content
+        except grpc.RpcError as e:
+            raise self._translate_error(e) from e
+
+    def prewarm(self) -> None:
+        # Listing models opens the gRPC channel without using tokens.
+        self._client().models.list_language_models()
+
+    async def aprewarm(self) -> None:
+        await self._async_client().models.list_language_models()
+
+    def _client(self):
+        _load_sdk(self.get_name())
+        return get_client(self.get_name(), self.api_key, lambda: xai_sdk.Client(api_key=self.api_key))
+
+    def _async_client(self):
+        _load_sdk(self.get_name())
+        return get_async_client(self.get_name(), self.api_key, lambda: xai_sdk.AsyncClient(api_key=self.api_key))
+
+    def _translate_error(self, e) -> ApiCallError:
+        code = e.code()
+        message = f"xAI API call failed ({code.name}): {e.details()}"
+        error_cls = _GRPC_ERRORS.get(code.name, ApiCallError)
+        return error_cls(message, service=self.get_name())
@@ -0,0 +1,161 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from unified_model_caller.errors import ApiCallError, InvalidResponseError
+from unified_model_caller.services import anthropic as anthropic_module
+from unified_model_caller.services import openai as openai_module
+from unified_model_caller.services.anthropic import AnthropicService
+from unified_model_caller.services.openai import OpenAIService
+
+
+@pytest.fixture(autouse=True)
+def _load_sdks():
+    # The tests patch out _client(), which is what normally imports the SDK.
+    openai_module._load_sdk("openai")
+    anthropic_module._load_sdk("anthropic")
+
+
+# ---------------------------------------------------------------------------
+# OpenAI
+# ---------------------------------------------------------------------------
+
+def _openai_line(custom_id, content):
+    body = {"choices": [{"message": {"content": content}}]}
+    return json.dumps({"custom_id": custom_id, "response": {"status_code": 200, "body": body}, "error": None})
+
+
+def _openai_error_line(custom_id, status_code=None, message="nope"):
+    if status_code is None:
+        return json.dumps({"custom_id": custom_id, "response": None, "error": {"code": "x", "message": message}})
+    body = {"error": {"message": message}}
+    return json.dumps({"custom_id": custom_id, "response": {"status_code": status_code, "body": body}, "error": None})
+
+
+def _openai_client(output_lines, error_lines=(), final_status="completed"):
+    files = {"file-out": output_lines, "file-err": error_lines}
+    client = MagicMock()
+    client.files.create.return_value = SimpleNamespace(id="file-in")
+    client.batches.create.return_value = SimpleNamespace(id="b1", status="in_progress")
+    client.batches.retrieve.return_value = SimpleNamespace(
+        id="b1",
+        status=final_status,
+        output_file_id="file-out" if output_lines else None,
+        error_file_id="file-err" if error_lines else None,
+    )
+    client.files.content.side_effect = lambda file_id: SimpleNamespace(text="\n".join(files[file_id]))
+    return client
+
+
+class TestOpenAIBatch:
+    def _call(self, client, prompts):
+        service = OpenAIService("key")
+        with patch.object(service, "_client", return_value=client):
+            return service.call_batch("gpt", prompts, poll_interval=0)
+
+    def test_results_follow_prompt_order(self):
+        client = _openai_client([_openai_line("1", "second"), _openai_line("0", "first")])
+        assert self._call(client, ["a", "b"]) == ["first", "second"]
+
+    def test_uploads_one_request_per_prompt(self):
+        client = _openai_client([_openai_line("0", "x"), _openai_line("1", "y")])
+        self._call(client, ["a", "b"])
+        _, payload = client.files.create.call_args.kwargs["file"]
+        requests = [json.loads(line) for line in payload.decode().splitlines()]
+        assert [r["custom_id"] for r in requests] == ["0", "1"]
+        assert requests[1]["body"] == {"model": "gpt", "messages": [{"role": "user", "content": "b"}]}
+        client.batches.create.assert_called_once_with(
+            input_file_id="file-in", endpoint="/v1/chat/completions", completion_window="24h"
+        )
+
+    def test_failed_batch_raises(self):
+        client = _openai_client([], final_status="expired")
+        with pytest.raises(ApiCallError, match="expired"):
+            self._call(client, ["a"])
+
+    def test_failed_requests_are_read_from_error_file(self):
+        client = _openai_client(
+            [_openai_line("0", "x")],
+            [_openai_error_line("2", message="boom"), _openai_error_line("1", 429, "Rate limit reached")],
+        )
+        with pytest.raises(ApiCallError) as excinfo:
+            self._call(client, ["a", "b", "c"])
+        assert str(excinfo.value) == (
+            "2 of 3 OpenAI batch requests failed: prompt 1: HTTP 429: Rate limit reached; prompt 2: boom"
+        )
+
+    def test_batch_where_every_request_failed_has_no_output_file(self):
+        client = _openai_client([], [_openai_error_line("0", 400, "bad request")])
+        with pytest.raises(ApiCallError, match="prompt 0: HTTP 400: bad request"):
+            self._call(client, ["a"])
+        client.files.content.assert_called_once_with("file-err")
+
+    def test_missing_result_raises(self):
+        client = _openai_client([_openai_line("0", "x")])
+        with pytest.raises(InvalidResponseError):
+            self._call(client, ["a", "b"])
+
+
+# ---------------------------------------------------------------------------
+# Anthropic
+# ---------------------------------------------------------------------------
+
+def _anthropic_item(custom_id, text=None, result_type="succeeded"):
+    if result_type == "succeeded":
+        result = SimpleNamespace(
+            type="succeeded", message=SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+        )
+    elif result_type == "errored":
+        result = SimpleNamespace(type="errored", error=SimpleNamespace(error=SimpleNamespace(message="bad")))
+    else:
+        result = SimpleNamespace(type=result_type)
+    return SimpleNamespace(custom_id=custom_id, result=result)
+
+
+def _anthropic_client(items):
+    client = MagicMock()
+    client.messages.batches.create.return_value = SimpleNamespace(id="b1", processing_status="in_progress")
+    client.messages.batches.retrieve.return_value = SimpleNamespace(id="b1", processing_status="ended")
+    client.messages.batches.results.return_value = iter(items)
+    return client
+
+
+class TestAnthropicBatch:
+    def _call(self, client, prompts):
+        service = AnthropicService("key")
+        with patch.object(service, "_client", return_value=client):
+            return service.call_batch("claude", prompts, poll_interval=0)
+
+    def test_results_follow_prompt_order(self):
+        client = _anthropic_client([_anthropic_item("1", "second"), _anthropic_item("0", "first")])
+        assert self._call(client, ["a", "b"]) == ["first", "second"]
+        client.messages.batches.retrieve.assert_called_once_with("b1")
+
+    def test_builds_one_request_per_prompt(self):
+        client = _anthropic_client([_anthropic_item("0", "x")])
+        self._call(client, ["a"])
+        (request,) = client.messages.batches.create.call_args.kwargs["requests"]
+        assert request["custom_id"] == "0"
+        assert request["params"]["messages"] == [{"role": "user", "content": "a"}]
+
+    def test_errored_request_raises(self):
+        client = _anthropic_client([_anthropic_item("0", result_type="errored")])
+        with pytest.raises(ApiCallError, match="bad"):
+            self._call(client, ["a"])
+
+    def test_expired_request_raises(self):
+        client = _anthropic_client([_anthropic_item("0", result_type="expired")])
+        with pytest.raises(ApiCallError, match="expired"):
+            self._call(client, ["a"])
+
+    def test_all_failed_requests_are_reported(self):
+        client = _anthropic_client([
+            _anthropic_item("2", result_type="expired"),
+            _anthropic_item("0", "x"),
+            _anthropic_item("1", result_type="errored"),
+        ])
+        with pytest.raises(ApiCallError) as excinfo:
+            self._call(client, ["a", "b", "c"])
+        assert str(excinfo.value) == "2 of 3 Anthropic batch requests failed: prompt 1: bad; prompt 2: expired"
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from unified_model_caller.cache import LRUCache, cache_key
+
+
+class TestLRUCache:
+    def test_miss_returns_none(self):
+        assert LRUCache().get("missing") is None
+
+    def test_set_then_get(self):
+        cache = LRUCache()
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", "3")
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+        assert len(cache) == 2
+
+    def test_expired_entries_are_dropped(self):
+        cache = LRUCache(ttl=10)
+        with patch("unified_model_caller.cache.time.monotonic", return_value=100.0):
+            cache.set("k", "v")
+        with patch("unified_model_caller.cache.time.monotonic", return_value=105.0):
+            assert cache.get("k") == "v"
+        with patch("unified_model_caller.cache.time.monotonic", return_value=111.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_no_ttl_never_expires(self):
+        cache = LRUCache(ttl=None)
+        with patch("unified_model_caller.cache.time.monotonic", return_value=0.0):
+            cache.set("k", "v")
+        with patch("unified_model_caller.cache.time.monotonic", return_value=1e9):
+            assert cache.get("k") == "v"
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.set("k", "v")
+        cache.clear()
+        assert cache.get("k") is None
+
+
+class TestCacheKey:
+    def test_is_deterministic(self):
+        assert cache_key("openai", "gpt", "hi") == cache_key("openai", "gpt", "hi")
+
+    def test_depends_on_every_field(self):
+        base = cache_key("openai", "gpt", "hi")
+        assert cache_key("anthropic", "gpt", "hi") != base
+        assert cache_key("openai", "gpt-mini", "hi") != base
+        assert cache_key("openai", "gpt", "hello") != base
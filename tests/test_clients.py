@@ -0,0 +1,100 @@
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from unified_model_caller.services import _clients
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches(monkeypatch):
+    monkeypatch.setattr(_clients, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(_clients, "_ASYNC_CLIENT_CACHE", _clients.weakref.WeakKeyDictionary())
+
+
+class TestGetClient:
+    def test_builds_once_per_key(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        first = _clients.get_client("svc", "key", factory)
+        second = _clients.get_client("svc", "key", factory)
+        assert first is second
+        assert len(calls) == 1
+
+    def test_separate_clients_per_api_key(self):
+        a = _clients.get_client("svc", "key-a", object)
+        b = _clients.get_client("svc", "key-b", object)
+        assert a is not b
+
+    def test_separate_clients_per_service(self):
+        a = _clients.get_client("svc-a", "key", object)
+        b = _clients.get_client("svc-b", "key", object)
+        assert a is not b
+
+
+class TestGetAsyncClient:
+    def test_shared_within_a_loop(self):
+        async def fetch_twice():
+            return _clients.get_async_client("svc", "key", object), _clients.get_async_client("svc", "key", object)
+
+        first, second = asyncio.run(fetch_twice())
+        assert first is second
+
+    def test_not_shared_across_loops(self):
+        async def fetch():
+            return _clients.get_async_client("svc", "key", object)
+
+        assert asyncio.run(fetch()) is not asyncio.run(fetch())
+
+    def test_requires_running_loop(self):
+        with pytest.raises(RuntimeError):
+            _clients.get_async_client("svc", "key", object)
+
+
+class TestRequirePackage:
+    def test_installed_module_is_returned(self):
+        assert _clients.require_package("asyncio", "asyncio", "svc") is asyncio
+
+    def test_missing_module_raises_api_call_error(self):
+        from unified_model_caller.errors import ApiCallError
+
+        with pytest.raises(ApiCallError, match="'openai' package") as excinfo:
+            _clients.require_package("unified_model_caller_missing_sdk", "openai", "openai")
+        assert excinfo.value.service == "openai"
+
+    def test_package_import_does_not_load_sdks(self):
+        code = (
+            "import sys, unified_model_caller; "
+            "print([m for m in ('openai', 'anthropic', 'google.genai', 'grpc', 'xai_sdk') if m in sys.modules])"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "[]"
+
+
+class TestHttpClients:
+    def test_shared_http_client_is_pooled(self):
+        assert isinstance(_clients.HTTP_CLIENT, _clients.httpx.Client)
+
+    def test_async_http_client_shared_within_a_loop(self):
+        async def fetch_twice():
+            return _clients.get_async_http_client(), _clients.get_async_http_client()
+
+        first, second = asyncio.run(fetch_twice())
+        assert first is second
+        assert isinstance(first, _clients.httpx.AsyncClient)
+
+    def test_openai_keeps_sdk_default_timeout(self):
+        from unified_model_caller.services import openai as openai_service
+
+        async def async_client():
+            return openai_service.OpenAIService("key")._async_client()
+
+        sync_client = openai_service.OpenAIService("key")._client()
+        assert sync_client.timeout == openai_service.openai.DEFAULT_TIMEOUT
+        assert sync_client._client is _clients.HTTP_CLIENT
+        assert asyncio.run(async_client()).timeout == openai_service.openai.DEFAULT_TIMEOUT
@@ -1,8 +1,11 @@
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, MagicMock
 
-from unified_model_caller import LLMCaller, BaseService
-from unified_model_caller.errors import InvalidServiceError
+from unified_model_caller import LLMCaller, BaseService, LRUCache
+from unified_model_caller.errors import InvalidServiceError, ModelOverloadedError, RateLimitError
 from unified_model_caller import core as core_module
 
 
@@ -49,6 +52,19 @@ def _patch_services(monkeypatch):
     yield fake
 
 
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for core.py; sleeping advances it instead of blocking."""
+    fake = SimpleNamespace(now=1000.0, sleeps=[])
+
+    def sleep(seconds):
+        fake.sleeps.append(seconds)
+        fake.now += seconds
+
+    monkeypatch.setattr(core_module, "time", SimpleNamespace(monotonic=lambda: fake.now, sleep=sleep))
+    return fake
+
+
 # ---------------------------------------------------------------------------
 # LLMCaller.__init__
 # ---------------------------------------------------------------------------
@@ -102,22 +118,481 @@ class TestCall:
             caller.call("x")
 
 
+# ---------------------------------------------------------------------------
+# LLMCaller retries
+# ---------------------------------------------------------------------------
+
+class _FlakyService(_EchoService):
+    """Fails with the class-level `errors` queue before answering."""
+    errors: list[Exception] = []
+
+    def call(self, model, prompt):
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+    async def acall(self, model, prompt):
+        return self.call(model, prompt)
+
+
+class TestRetry:
+    @pytest.fixture(autouse=True)
+    def _register(self):
+        core_module._SERVICES["flaky"] = _FlakyService
+        _FlakyService.errors = []
+
+    def test_retries_rate_limit_then_succeeds(self, clock):
+        _FlakyService.errors = [RateLimitError("slow down"), ModelOverloadedError("busy")]
+        caller = LLMCaller("flaky", "m", jitter=0)
+        assert caller.call("x") == "ok"
+        assert clock.sleeps == [1.0, 2.0]
+
+    def test_raises_after_max_retries(self):
+        _FlakyService.errors = [RateLimitError("slow down")] * 4
+        caller = LLMCaller("flaky", "m", max_retries=2, jitter=0)
+        with patch("unified_model_caller.core.time.sleep") as mock_sleep:
+            with pytest.raises(RateLimitError):
+                caller.call("x")
+        assert mock_sleep.call_count == 2
+
+    def test_zero_retries_raises_immediately(self):
+        _FlakyService.errors = [ModelOverloadedError("busy")]
+        caller = LLMCaller("flaky", "m", max_retries=0)
+        with patch("unified_model_caller.core.time.sleep") as mock_sleep:
+            with pytest.raises(ModelOverloadedError):
+                caller.call("x")
+        mock_sleep.assert_not_called()
+
+    def test_non_retryable_errors_are_not_retried(self):
+        _FlakyService.errors = [RuntimeError("boom")]
+        caller = LLMCaller("flaky", "m")
+        with patch("unified_model_caller.core.time.sleep") as mock_sleep:
+            with pytest.raises(RuntimeError):
+                caller.call("x")
+        mock_sleep.assert_not_called()
+
+    def test_backoff_is_capped_and_jittered(self):
+        caller = LLMCaller("flaky", "m", backoff_base=1.0, backoff_cap=4.0, jitter=0.5)
+        with patch("unified_model_caller.core.random.random", return_value=1.0):
+            assert caller._backoff_delay(0) == 1.5
+            assert caller._backoff_delay(5) == 4.5
+
+    def test_acall_retries(self, clock):
+        _FlakyService.errors = [RateLimitError("slow down")]
+        caller = LLMCaller("flaky", "m", jitter=0)
+        with patch("unified_model_caller.core.asyncio.sleep") as mock_sleep:
+            assert asyncio.run(caller.acall("x")) == "ok"
+        mock_sleep.assert_called_once_with(1.0)
+
+
+# ---------------------------------------------------------------------------
+# LLMCaller key rotation
+# ---------------------------------------------------------------------------
+
+class _KeyedService(_TokenService):
+    """Records which key served each call; keys listed in `limited` are rate-limited."""
+    used: list[str] = []
+    limited: set[str] = set()
+
+    def call(self, model, prompt):
+        type(self).used.append(self.api_key)
+        if self.api_key in self.limited:
+            raise RateLimitError("slow down")
+        return self.api_key
+
+
+class TestKeyRotation:
+    @pytest.fixture(autouse=True)
+    def _register(self):
+        core_module._SERVICES["keyed"] = _KeyedService
+        _KeyedService.used = []
+        _KeyedService.limited = set()
+
+    def test_one_service_per_key(self):
+        caller = LLMCaller("keyed", "m", api_key=["a", "b"])
+        assert [svc.api_key for svc in caller._services] == ["a", "b"]
+
+    def test_empty_key_list_raises(self):
+        with pytest.raises(ValueError):
+            LLMCaller("keyed", "m", api_key=[])
+
+    def test_round_robin(self, clock):
+        caller = LLMCaller("keyed", "m", api_key=["a", "b", "c"])
+        assert [caller.call("x") for _ in range(4)] == ["a", "b", "c", "a"]
+        # Every key was used right away, so the fourth call waits out "a"'s cooldown.
+        assert clock.sleeps == [2.0]
+
+    def test_rate_limited_key_is_benched_without_backoff(self):
+        _KeyedService.limited = {"a"}
+        caller = LLMCaller("keyed", "m", api_key=["a", "b"], respect_cooldown=False)
+        with patch("unified_model_caller.core.time.sleep") as mock_sleep:
+            assert caller.call("x") == "b"
+            assert caller.call("y") == "b"  # "a" is still cooling down
+        mock_sleep.assert_not_called()
+        assert _KeyedService.used == ["a", "b", "b"]
+
+    def test_waits_for_soonest_key_when_all_are_cooling(self, clock):
+        _KeyedService.limited = {"a", "b"}
+        caller = LLMCaller("keyed", "m", api_key=["a", "b"], max_retries=2, jitter=0)
+        with pytest.raises(RateLimitError):
+            caller.call("x")
+        assert _KeyedService.used == ["a", "b", "a"]
+        # Resting "b" leaves no ready key, so the retry waits out "a"'s cooldown.
+        assert clock.sleeps == [2.0]
+
+    def test_single_key_only_backs_off(self, clock):
+        _KeyedService.limited = {"a"}
+        caller = LLMCaller("keyed", "m", api_key="a", max_retries=1, jitter=0, respect_cooldown=False)
+        with pytest.raises(RateLimitError):
+            caller.call("x")
+        assert clock.sleeps == [1.0]
+
+    def test_backoff_overlaps_the_cooldown(self, clock):
+        _KeyedService.limited = {"a"}
+        caller = LLMCaller("keyed", "m", api_key="a", max_retries=1, jitter=0)
+        with pytest.raises(RateLimitError):
+            caller.call("x")
+        # The 1s backoff falls within the 2s cooldown reserved by the failed request.
+        assert clock.sleeps == [2.0]
+
+    def test_zero_cooldown_keys_still_back_off(self, clock):
+        class _FreeKeyedService(_KeyedService):
+            def service_cooldown(self):
+                return 0
+
+        core_module._SERVICES["freekeyed"] = _FreeKeyedService
+        _KeyedService.limited = {"a", "b"}
+        caller = LLMCaller("freekeyed", "m", api_key=["a", "b"], max_retries=3, jitter=0)
+        with pytest.raises(RateLimitError):
+            caller.call("x")
+        assert _KeyedService.used == ["a", "b", "a", "b"]
+        # "a" rests 1s, "b" 2s and "a" 4s; with no key ready, each retry waits for the soonest.
+        assert clock.sleeps == [1.0, 1.0]
+
+    def test_acall_rotates(self):
+        caller = LLMCaller("keyed", "m", api_key=["a", "b"])
+        assert asyncio.run(caller.acall_many(["x", "y"])) == ["a", "b"]
+
+
+# ---------------------------------------------------------------------------
+# LLMCaller response cache
+# ---------------------------------------------------------------------------
+
+class _CountingService(_EchoService):
+    calls = 0
+
+    def call(self, model, prompt):
+        type(self).calls += 1
+        return super().call(model, prompt)
+
+
+class TestCache:
+    @pytest.fixture(autouse=True)
+    def _register(self):
+        core_module._SERVICES["counting"] = _CountingService
+        _CountingService.calls = 0
+
+    def test_disabled_by_default(self):
+        caller = LLMCaller("counting", "m")
+        caller.call("x")
+        caller.call("x")
+        assert _CountingService.calls == 2
+
+    def test_repeated_prompt_is_served_from_cache(self):
+        caller = LLMCaller("counting", "m", cache=LRUCache())
+        assert caller.call("x") == "m:x"
+        assert caller.call("x") == "m:x"
+        assert _CountingService.calls == 1
+
+    def test_different_prompts_and_models_miss(self):
+        cache = LRUCache()
+        LLMCaller("counting", "m1", cache=cache).call("x")
+        LLMCaller("counting", "m1", cache=cache).call("y")
+        LLMCaller("counting", "m2", cache=cache).call("x")
+        assert _CountingService.calls == 3
+
+    def test_failed_calls_are_not_cached(self):
+        _FlakyService.errors = [RuntimeError("boom")]
+        core_module._SERVICES["flaky"] = _FlakyService
+        caller = LLMCaller("flaky", "m", cache=LRUCache())
+        with pytest.raises(RuntimeError):
+            caller.call("x")
+        assert caller.call("x") == "ok"
+
+    def test_acall_shares_the_cache(self):
+        caller = LLMCaller("counting", "m", cache=LRUCache())
+        caller.call("x")
+        assert asyncio.run(caller.acall("x")) == "m:x"
+        assert _CountingService.calls == 1
+
+
+# ---------------------------------------------------------------------------
+# LLMCaller call specialization
+# ---------------------------------------------------------------------------
+
+class TestSpecialization:
+    def _is_specialized(self, caller):
+        return "call" in caller.__dict__
+
+    def test_plain_caller_is_specialized(self):
+        caller = LLMCaller("echo", "m", max_retries=0)
+        assert self._is_specialized(caller)
+        assert caller.call("x") == "m:x"
+
+    @pytest.mark.parametrize("kwargs", [
+        {},  # retries are enabled by default
+        {"max_retries": 0, "cache": LRUCache()},
+        {"max_retries": 0, "api_key": ["a", "b"]},
+    ])
+    def test_not_specialized_when_wrapping_is_needed(self, kwargs):
+        assert not self._is_specialized(LLMCaller("echo", "m", **kwargs))
+
+    def test_cooldown_prevents_specialization_unless_ignored(self):
+        assert not self._is_specialized(LLMCaller("tokenservice", "m", max_retries=0))
+        assert self._is_specialized(LLMCaller("tokenservice", "m", max_retries=0, respect_cooldown=False))
+
+    def test_changing_settings_respecializes(self):
+        caller = LLMCaller("echo", "m", max_retries=0)
+        caller.cache = LRUCache()
+        assert not self._is_specialized(caller)
+        caller.cache = None
+        assert self._is_specialized(caller)
+
+    def test_changing_model_rebinds(self):
+        caller = LLMCaller("echo", "m", max_retries=0)
+        caller.model = "other"
+        assert caller.call("x") == "other:x"
+
+    def test_subclass_overriding_call_is_not_bypassed(self):
+        class _PrefixCaller(LLMCaller):
+            def call(self, prompt):
+                return "sub:" + super().call(prompt)
+
+        caller = _PrefixCaller("echo", "m", max_retries=0)
+        assert not self._is_specialized(caller)
+        assert caller.call("x") == "sub:m:x"
+
+
+# ---------------------------------------------------------------------------
+# LLMCaller.stream
+# ---------------------------------------------------------------------------
+
+class _StreamingService(_EchoService):
+    """Streams the prompt word by word, failing with `errors[i]` after `fail_after[i]` words."""
+    errors: list[Exception] = []
+    fail_after: list[int] = []
+
+    def stream(self, model, prompt):
+        error = self.errors.pop(0) if self.errors else None
+        limit = self.fail_after.pop(0) if self.fail_after else 0
+        for count, word in enumerate(prompt.split()):
+            if error is not None and count == limit:
+                raise error
+            yield word
+
+
+class TestStream:
+    @pytest.fixture(autouse=True)
+    def _register(self):
+        core_module._SERVICES["streaming"] = _StreamingService
+        _StreamingService.errors = []
+        _StreamingService.fail_after = []
+
+    def test_default_stream_yields_whole_response(self):
+        assert list(LLMCaller("echo", "m").stream("hi")) == ["m:hi"]
+
+    def test_yields_service_pieces(self):
+        assert list(LLMCaller("streaming", "m").stream("a b c")) == ["a", "b", "c"]
+
+    def test_retries_before_first_piece(self, clock):
+        _StreamingService.errors = [RateLimitError("slow down")]
+        _StreamingService.fail_after = [0]
+        caller = LLMCaller("streaming", "m", jitter=0)
+        assert list(caller.stream("a b")) == ["a", "b"]
+        assert clock.sleeps == [1.0]
+
+    def test_no_retry_once_text_was_yielded(self):
+        _StreamingService.errors = [RateLimitError("slow down")]
+        _StreamingService.fail_after = [1]
+        received = []
+        with pytest.raises(RateLimitError):
+            for piece in LLMCaller("streaming", "m").stream("a b"):
+                received.append(piece)
+        assert received == ["a"]
+
+    def test_completed_stream_is_cached(self):
+        cache = LRUCache()
+        caller = LLMCaller("streaming", "m", cache=cache)
+        assert list(caller.stream("a b")) == ["a", "b"]
+        assert caller.call("a b") == "ab"
+
+
+# ---------------------------------------------------------------------------
+# LLMCaller.acall / acall_many
+# ---------------------------------------------------------------------------
+
+class TestAcall:
+    def test_default_acall_runs_sync_call(self):
+        caller = LLMCaller("echo", "gpt")
+        assert asyncio.run(caller.acall("hello")) == "gpt:hello"
+
+    def test_uses_service_async_override(self):
+        class _AsyncService(_EchoService):
+            async def acall(self, model, prompt):
+                return f"async:{prompt}"
+
+        core_module._SERVICES["asyncservice"] = _AsyncService
+
+        caller = LLMCaller("asyncservice", "m")
+        assert asyncio.run(caller.acall("hi")) == "async:hi"
+
+    def test_acall_many_preserves_order(self):
+        caller = LLMCaller("echo", "m")
+        results = asyncio.run(caller.acall_many(["a", "b", "c"]))
+        assert results == ["m:a", "m:b", "m:c"]
+
+    def test_acall_many_runs_concurrently(self):
+        class _SlowService(_EchoService):
+            running = 0
+            peak = 0
+
+            def service_cooldown(self):
+                return 60_000
+
+            async def acall(self, model, prompt):
+                cls = type(self)
+                cls.running += 1
+                cls.peak = max(cls.peak, cls.running)
+                await asyncio.sleep(0.01)
+                cls.running -= 1
+                return prompt
+
+        core_module._SERVICES["slow"] = _SlowService
+
+        caller = LLMCaller("slow", "m")
+        asyncio.run(asyncio.wait_for(caller.acall_many(["a", "b", "c"]), timeout=5))
+        assert _SlowService.peak == 3
+
+    def test_acall_many_retries_rate_limited_requests(self):
+        _FlakyService.errors = [RateLimitError("slow down")]
+        core_module._SERVICES["flaky"] = _FlakyService
+
+        caller = LLMCaller("flaky", "m", max_retries=1, backoff_base=0, jitter=0)
+        assert asyncio.run(caller.acall_many(["a", "b"])) == ["ok", "ok"]
+        assert _FlakyService.errors == []
+
+
+# ---------------------------------------------------------------------------
+# LLMCaller.call_batch
+# ---------------------------------------------------------------------------
+
+class _BatchService(_EchoService):
+    batches: list[list[str]] = []
+
+    def supports_batch(self):
+        return True
+
+    def call_batch(self, model, prompts, poll_interval):
+        type(self).batches.append(prompts)
+        return [p.upper() for p in prompts]
+
+
+class TestCallBatch:
+    def test_uses_service_batch_api(self):
+        core_module._SERVICES["batch"] = _BatchService
+        _BatchService.batches = []
+        assert LLMCaller("batch", "m").call_batch(["a", "b"]) == ["A", "B"]
+        assert _BatchService.batches == [["a", "b"]]
+
+    def test_falls_back_to_concurrent_calls(self):
+        assert LLMCaller("echo", "m").call_batch(["a", "b"]) == ["m:a", "m:b"]
+
+    def test_empty_batch(self):
+        assert LLMCaller("echo", "m").call_batch([]) == []
+
+
+# ---------------------------------------------------------------------------
+# LLMCaller.prewarm / aprewarm
+# ---------------------------------------------------------------------------
+
+class _WarmingService(_TokenService):
+    warmed: list[str] = []
+
+    def prewarm(self):
+        if self.api_key == "broken":
+            raise ConnectionError("unreachable")
+        type(self).warmed.append(self.api_key)
+
+
+class TestPrewarm:
+    @pytest.fixture(autouse=True)
+    def _register(self):
+        core_module._SERVICES["warming"] = _WarmingService
+        _WarmingService.warmed = []
+
+    def test_default_prewarm_is_a_no_op(self):
+        LLMCaller("echo", "m").prewarm()
+
+    def test_prewarms_every_key(self):
+        LLMCaller("warming", "m", api_key=["a", "b"]).prewarm()
+        assert _WarmingService.warmed == ["a", "b"]
+
+    def test_errors_are_swallowed(self):
+        LLMCaller("warming", "m", api_key=["broken", "b"]).prewarm()
+        assert _WarmingService.warmed == ["b"]
+
+    def test_aprewarm_defaults_to_sync_prewarm(self):
+        asyncio.run(LLMCaller("warming", "m", api_key=["broken", "a"]).aprewarm())
+        assert _WarmingService.warmed == ["a"]
+
+
 # ---------------------------------------------------------------------------
 # LLMCaller.wait_cooldown
 # ---------------------------------------------------------------------------
 
 class TestWaitCooldown:
-    def test_sleeps_cooldown_in_seconds(self):
+    def test_no_wait_before_first_call(self, clock):
         caller = LLMCaller("tokenservice", "m")  # cooldown = 2000 ms
-        with patch("unified_model_caller.core.time.sleep") as mock_sleep:
-            caller.wait_cooldown()
-            mock_sleep.assert_called_once_with(2.0)
-
-    def test_zero_cooldown(self):
+        caller.wait_cooldown()
+        assert clock.sleeps == []
+
+    def test_sleeps_cooldown_in_seconds(self, clock):
+        caller = LLMCaller("tokenservice", "m")
+        caller.call("x")
+        caller.wait_cooldown()
+        assert clock.sleeps == [2.0]
+
+    def test_sleeps_only_the_remaining_time(self, clock):
+        caller = LLMCaller("tokenservice", "m")
+        caller.call("x")
+        clock.now += 1.5
+        caller.wait_cooldown()
+        assert clock.sleeps == [0.5]
+
+    def test_zero_cooldown(self, clock):
         caller = LLMCaller("echo", "m")  # cooldown = 0
-        with patch("unified_model_caller.core.time.sleep") as mock_sleep:
-            caller.wait_cooldown()
-            mock_sleep.assert_called_once_with(0.0)
+        caller.call("x")
+        caller.wait_cooldown()
+        assert clock.sleeps == []
+
+    def test_call_waits_cooldown_between_calls(self, clock):
+        caller = LLMCaller("tokenservice", "m")
+        caller.call("x")
+        caller.call("y")
+        assert clock.sleeps == [2.0]
+
+    def test_call_after_wait_cooldown_does_not_wait_again(self, clock):
+        caller = LLMCaller("tokenservice", "m")
+        caller.call("x")
+        caller.wait_cooldown()
+        caller.call("y")
+        assert clock.sleeps == [2.0]
+
+    def test_respect_cooldown_disabled(self, clock):
+        caller = LLMCaller("tokenservice", "m", respect_cooldown=False)
+        caller.call("x")
+        caller.call("y")
+        assert clock.sleeps == []
 
 
 # ---------------------------------------------------------------------------
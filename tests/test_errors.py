@@ -1,5 +1,9 @@
+import asyncio
+import json
+
+import httpx
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 from unified_model_caller.errors import (
     ApiCallError,
@@ -15,8 +19,20 @@ from unified_model_caller.errors import (
     ServiceUnavailableError,
     UnifiedModelCallerError,
     error_from_status,
+    is_overloaded,
+    is_rate_limited,
+)
+from unified_model_caller.services import _clients, _http
+from unified_model_caller.services import anthropic as anthropic_service
+from unified_model_caller.services import google as google_service
+from unified_model_caller.services import openai as openai_service
+from unified_model_caller.services._http import (
+    apost_chat_completion,
+    post_chat_completion,
+    stream_chat_completion,
 )
-from unified_model_caller.services._http import post_chat_completion
+from unified_model_caller.services.aristoteonmydocker import AristoteOnMyDockerService
+from unified_model_caller.services.ilaas import IlaasService
 
 
 # ---------------------------------------------------------------------------
@@ -83,24 +99,46 @@ class TestErrorFromStatus:
 
 
 # ---------------------------------------------------------------------------
-# post_chat_completion (requests-based services)
+# Message classification
+# ---------------------------------------------------------------------------
+
+class TestMessageClassification:
+    @pytest.mark.parametrize("message", [
+        "The model is overloaded",
+        "{'type': 'overloaded_error'}",
+        "503 UNAVAILABLE. Model OVERLOADED, try later",
+    ])
+    def test_overloaded(self, message):
+        assert is_overloaded(message)
+
+    @pytest.mark.parametrize("message", [
+        "429 RESOURCE_EXHAUSTED",
+        "Rate limit reached for requests",
+        "rate_limit_error",
+        "resource exhausted",
+    ])
+    def test_rate_limited(self, message):
+        assert is_rate_limited(message)
+        assert not is_overloaded(message)
+
+    def test_unrelated_message(self):
+        assert not is_overloaded("invalid api key")
+        assert not is_rate_limited("invalid api key")
+
+
+# ---------------------------------------------------------------------------
+# post_chat_completion (plain-HTTP services)
 # ---------------------------------------------------------------------------
 
 def _mock_response(status_code=200, json_data=None, text=""):
-    response = MagicMock()
-    response.status_code = status_code
-    response.ok = status_code < 400
-    response.text = text
     if json_data is not None:
-        response.json.return_value = json_data
-    else:
-        response.json.side_effect = ValueError("no json")
-    return response
+        return httpx.Response(status_code, json=json_data)
+    return httpx.Response(status_code, text=text)
 
 
 class TestPostChatCompletion:
     def _call(self, response=None, side_effect=None):
-        with patch("unified_model_caller.services._http.requests.post") as mock_post:
+        with patch("unified_model_caller.services._http.HTTP_CLIENT.post") as mock_post:
             if side_effect is not None:
                 mock_post.side_effect = side_effect
             else:
@@ -134,14 +172,12 @@ class TestPostChatCompletion:
         assert excinfo.value.service == "ilaas"
 
     def test_network_failure_raises_connection_error(self):
-        import requests
         with pytest.raises(ApiConnectionError):
-            self._call(side_effect=requests.ConnectionError("refused"))
+            self._call(side_effect=httpx.ConnectError("refused"))
 
     def test_timeout_raises_connection_error(self):
-        import requests
         with pytest.raises(ApiConnectionError):
-            self._call(side_effect=requests.Timeout("too slow"))
+            self._call(side_effect=httpx.ReadTimeout("too slow"))
 
     def test_malformed_body_raises_invalid_response(self):
         response = _mock_response(json_data={"unexpected": "shape"})
@@ -159,3 +195,218 @@ class TestPostChatCompletion:
         })
         with pytest.raises(InvalidResponseError):
             self._call(response)
+
+
+class TestApostChatCompletion:
+    def _call(self, response=None, side_effect=None):
+        mock_post = AsyncMock(return_value=response, side_effect=side_effect)
+        with patch.object(httpx.AsyncClient, "post", mock_post):
+            return asyncio.run(apost_chat_completion(
+                endpoint="https://example.test/v1/chat/completions",
+                model="m",
+                prompt="hi",
+                service="ilaas",
+                api_key="key",
+            ))
+
+    def test_returns_content_on_success(self):
+        response = httpx.Response(200, json={"choices": [{"message": {"content": "hello"}}]})
+        assert self._call(response) == "hello"
+
+    @pytest.mark.parametrize("status,expected", [
+        (401, AuthenticationError),
+        (404, NotFoundError),
+        (429, RateLimitError),
+        (529, ModelOverloadedError),
+    ])
+    def test_http_error_statuses(self, status, expected):
+        with pytest.raises(expected) as excinfo:
+            self._call(httpx.Response(status, text="details"))
+        assert excinfo.value.status_code == status
+        assert excinfo.value.service == "ilaas"
+
+    def test_network_failure_raises_connection_error(self):
+        with pytest.raises(ApiConnectionError):
+            self._call(side_effect=httpx.ConnectError("refused"))
+
+    def test_malformed_body_raises_invalid_response(self):
+        with pytest.raises(InvalidResponseError):
+            self._call(httpx.Response(200, json={"unexpected": "shape"}))
+
+
+class TestChatCompletionService:
+    def _post(self, service):
+        response = _mock_response(json_data={"choices": [{"message": {"content": "hello"}}]})
+        with patch("unified_model_caller.services._http.HTTP_CLIENT.post", return_value=response) as mock_post:
+            assert service.call("m", "hi") == "hello"
+        return mock_post
+
+    def test_posts_to_service_endpoint_with_key(self):
+        mock_post = self._post(IlaasService("key"))
+        assert mock_post.call_args.args[0] == IlaasService.endpoint
+        assert json.loads(mock_post.call_args.kwargs["content"]) == {
+            "model": "m",
+            "messages": [{"role": "user", "content": "hi"}],
+        }
+        assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Bearer key"
+
+    def test_key_omitted_when_not_required(self):
+        mock_post = self._post(AristoteOnMyDockerService("key"))
+        assert "Authorization" not in mock_post.call_args.kwargs["headers"]
+
+
+class TestStreamChatCompletion:
+    def _stream(self, monkeypatch, handler):
+        monkeypatch.setattr(_http, "HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+        return list(stream_chat_completion(
+            endpoint="https://example.test/v1/chat/completions",
+            model="m",
+            prompt="hi",
+            service="ilaas",
+            api_key="key",
+        ))
+
+    @staticmethod
+    def _events(*payloads):
+        lines = [f"data: {json.dumps(p)}" if isinstance(p, dict) else f"data: {p}" for p in payloads]
+        return httpx.Response(200, text="\n\n".join(lines) + "\n\n")
+
+    def test_yields_content_deltas(self, monkeypatch):
+        def handler(request):
+            assert json.loads(request.content)["stream"] is True
+            return self._events(
+                {"choices": [{"delta": {"role": "assistant"}}]},
+                {"choices": [{"delta": {"content": "Hel"}}]},
+                {"choices": [{"delta": {"content": "lo"}}]},
+                "[DONE]",
+            )
+
+        assert self._stream(monkeypatch, handler) == ["Hel", "lo"]
+
+    def test_http_error_status(self, monkeypatch):
+        with pytest.raises(RateLimitError):
+            self._stream(monkeypatch, lambda request: httpx.Response(429, text="slow down"))
+
+    def test_malformed_event_raises_invalid_response(self, monkeypatch):
+        with pytest.raises(InvalidResponseError):
+            self._stream(monkeypatch, lambda request: self._events("{not json"))
+
+    def test_network_failure_raises_connection_error(self, monkeypatch):
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        with pytest.raises(ApiConnectionError):
+            self._stream(monkeypatch, handler)
+
+    @pytest.mark.parametrize("error, expected", [
+        ({"message": "The model is overloaded"}, ModelOverloadedError),
+        ({"message": "Rate limit exceeded", "code": "rate_limit_exceeded"}, RateLimitError),
+        ({"message": "Bad gateway", "code": 502}, ServiceUnavailableError),
+        ({"message": "Something broke"}, ApiCallError),
+    ])
+    def test_error_event_is_classified(self, monkeypatch, error, expected):
+        def handler(request):
+            return self._events({"choices": [{"delta": {"content": "Hel"}}]}, {"error": error})
+
+        with pytest.raises(ApiCallError) as excinfo:
+            self._stream(monkeypatch, handler)
+        assert type(excinfo.value) is expected
+        assert error["message"] in str(excinfo.value)
+
+
+# ---------------------------------------------------------------------------
+# OpenAIService.stream (SDK over a mocked transport)
+# ---------------------------------------------------------------------------
+
+class TestOpenAIStream:
+    @pytest.fixture(autouse=True)
+    def _empty_client_cache(self, monkeypatch):
+        monkeypatch.setattr(_clients, "_CLIENT_CACHE", {})
+
+    def _stream(self, monkeypatch, handler):
+        monkeypatch.setattr(openai_service, "HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+        return list(openai_service.OpenAIService("key").stream("gpt", "hi"))
+
+    @staticmethod
+    def _chunk(content):
+        return {"id": "c", "object": "chat.completion.chunk", "created": 0, "model": "gpt",
+                "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}]}
+
+    def test_yields_content_deltas(self, monkeypatch):
+        def handler(request):
+            return TestStreamChatCompletion._events(self._chunk("Hel"), self._chunk("lo"), "[DONE]")
+
+        assert self._stream(monkeypatch, handler) == ["Hel", "lo"]
+
+    def test_overload_event_mid_stream_raises_overloaded(self, monkeypatch):
+        def handler(request):
+            return TestStreamChatCompletion._events(
+                self._chunk("Hel"), {"error": {"message": "The server is overloaded"}}
+            )
+
+        with pytest.raises(ModelOverloadedError, match="overloaded"):
+            self._stream(monkeypatch, handler)
+
+    def test_other_error_event_mid_stream_raises_api_call_error(self, monkeypatch):
+        def handler(request):
+            return TestStreamChatCompletion._events(self._chunk("Hel"), {"error": {"message": "Something broke"}})
+
+        with pytest.raises(ApiCallError, match="Something broke") as excinfo:
+            self._stream(monkeypatch, handler)
+        assert not isinstance(excinfo.value, ModelOverloadedError)
+
+
+# ---------------------------------------------------------------------------
+# Provider error translation (SDK-backed services)
+# ---------------------------------------------------------------------------
+
+class TestTranslateError:
+    @staticmethod
+    def _status_error(sdk, status, message):
+        request = httpx.Request("POST", "https://example.test")
+        return sdk.APIStatusError(message, response=httpx.Response(status, request=request), body=None)
+
+    @staticmethod
+    def _loaded(module, service_cls):
+        service = service_cls("key")
+        module._load_sdk(service.get_name())
+        return service
+
+    @pytest.fixture(params=[
+        (openai_service, openai_service.OpenAIService),
+        (anthropic_service, anthropic_service.AnthropicService),
+    ], ids=["openai", "anthropic"])
+    def sdk_service(self, request):
+        """An SDK-backed service and its loaded SDK module."""
+        module, service_cls = request.param
+        service = self._loaded(module, service_cls)
+        return service, getattr(module, service.get_name())
+
+    def test_overload_is_recognised_whatever_the_status(self, sdk_service):
+        service, sdk = sdk_service
+        error = service._translate_error(self._status_error(sdk, 200, "Overloaded"))
+        assert isinstance(error, ModelOverloadedError)
+        assert error.status_code == 200
+
+    def test_status_maps_to_error_class(self, sdk_service):
+        service, sdk = sdk_service
+        assert isinstance(service._translate_error(self._status_error(sdk, 429, "slow down")), RateLimitError)
+
+    @pytest.mark.parametrize("message, expected", [
+        ("429 Resource exhausted", RateLimitError),
+        ("Rate limit reached for requests", RateLimitError),
+        ("The model is overloaded", ModelOverloadedError),
+        ("Something else", ApiCallError),
+    ])
+    def test_google_classifies_errors_without_status(self, message, expected):
+        service = self._loaded(google_service, google_service.GoogleService)
+        assert type(service._translate_error(RuntimeError(message))) is expected
+
+    def test_google_overloaded_api_error(self):
+        service = self._loaded(google_service, google_service.GoogleService)
+        api_error = google_service.g_errors.APIError(
+            503, {"error": {"message": "The model is overloaded.", "status": "UNAVAILABLE"}}
+        )
+        error = service._translate_error(api_error)
+        assert isinstance(error, ModelOverloadedError)
+        assert error.status_code == 503